@@ -0,0 +1,791 @@
+#!/usr/bin/env python3
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generates a static HTML leaderboard site from k8s-ai-bench results.
+
+Reads the per-run JSONL results produced by the eval runs (one JSON object
+per line with "model", "task", "run", "result" and "error" fields) and
+writes a small static site (leaderboard, per-task and per-model pages)
+suitable for publishing to GCS or GitHub Pages.
+
+Usage:
+    generate-benchmark-site.py --input .build/k8s-ai-bench.jsonl \
+        --output-dir .build/k8s-ai-bench-site
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # keep working on runners without numpy
+    np = None
+
+try:
+    import orjson
+except ImportError:  # keep working on runners without orjson
+    orjson = None
+
+
+def loads(s):
+    """Decodes one JSON document, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def dumps(obj):
+    """Encodes to compact JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+# Maps a lowercase substring of the model name to a display category.
+MODEL_KEYWORDS = {
+    "gemini": "Gemini",
+    "gemma": "Gemma",
+    "gpt": "OpenAI",
+    "o1": "OpenAI",
+    "o3": "OpenAI",
+    "claude": "Anthropic",
+    "llama": "Llama",
+    "grok": "Grok",
+    "qwen": "Qwen",
+    "deepseek": "DeepSeek",
+}
+
+
+# One C-level scan over the name instead of a Python loop per keyword.
+_KEYWORD_RE = re.compile("|".join(map(re.escape, MODEL_KEYWORDS)), re.IGNORECASE)
+
+
+def get_model_type(model):
+    """Returns the display category for a model name."""
+    match = _KEYWORD_RE.search(model)
+    if match:
+        return MODEL_KEYWORDS[match.group(0).lower()]
+    return "Other"
+
+
+def pass_at_k(n, c, k):
+    """pass@k: chance that at least one of k i.i.d. samples succeeds,
+
+    estimated from n observed runs of which c succeeded. The common
+    all-fail, all-pass and k=1 cases are answered without the float pow.
+    """
+    if n == 0 or c == 0:
+        return 0.0
+    if c == n:
+        return 1.0
+    if k == 1:
+        return c / n
+    return 1.0 - (1.0 - c / n) ** k
+
+
+def read_results(path):
+    """Yields one decoded result dict per non-empty JSONL line."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield loads(line)
+
+
+def process_data(stream):
+    """Aggregates the result stream in a single pass.
+
+    Each item updates a per-(model, task) accumulator [n, c, runs] directly,
+    so the raw records are never materialized as a list. The leaderboard,
+    per-task and per-model views are then derived from the accumulators.
+    """
+    # stats[model][task] = [n, c, runs]
+    stats = {}
+    # Inverted index so the per-task view only visits models that ran the task.
+    task_to_models = {}
+    for item in stream:
+        model = item.get("model", "unknown")
+        t_name = item.get("task", "unknown")
+        res = item.get("result")
+        # Decide success once here; every later pass reuses the boolean.
+        is_success = isinstance(res, str) and res.lower() == "success"
+        acc = stats.setdefault(model, {}).setdefault(t_name, [0, 0, []])
+        acc[0] += 1
+        if acc[0] == 1:
+            task_to_models.setdefault(t_name, []).append(model)
+        if is_success:
+            acc[1] += 1
+        # The run number is spliced into markup unescaped, so force it
+        # numeric here; malformed values fall back to the arrival index.
+        try:
+            run = int(item.get("run", acc[0]))
+        except (TypeError, ValueError):
+            run = acc[0]
+        acc[2].append(
+            {
+                "run": run,
+                "res": res,
+                "msg": item.get("error", "") or "",
+                "_ok": is_success,
+            }
+        )
+
+    # Categorize each model once; the leaderboard and task breakdowns share it.
+    model_type = {m: get_model_type(m) for m in stats}
+
+    # Leaderboard: pass@1 / pass@5 averaged over the tasks each model ran.
+    leaderboard = []
+    model_details_map = {}
+    for model, tasks_map in stats.items():
+        if np is not None:
+            # Vectorized pass@k over all of this model's tasks at once.
+            count = len(tasks_map)
+            ns = np.fromiter((v[0] for v in tasks_map.values()), dtype=np.int32, count=count)
+            cs = np.fromiter((v[1] for v in tasks_map.values()), dtype=np.int32, count=count)
+            probs = cs.astype(np.float64) / ns
+            # Coerce to builtins: orjson refuses numpy scalars.
+            avg_p1 = float(probs.mean() * 100)
+            avg_p5 = float((1.0 - (1.0 - probs) ** 5).mean() * 100)
+            total_runs = int(ns.sum())
+        else:
+            p1_scores = []
+            p5_scores = []
+            for n, c, _ in tasks_map.values():
+                p1_scores.append(pass_at_k(n, c, 1))
+                p5_scores.append(pass_at_k(n, c, 5))
+            avg_p1 = sum(p1_scores) / len(p1_scores) * 100
+            avg_p5 = sum(p5_scores) / len(p5_scores) * 100
+            total_runs = sum(n for n, _, _ in tasks_map.values())
+        leaderboard.append(
+            {
+                "id": model,
+                "type": model_type[model],
+                "p1": round(avg_p1, 1),
+                "p5": round(avg_p5, 1),
+                "tasks": len(tasks_map),
+                "runs": total_runs,
+            }
+        )
+
+        # Column-wise layout: one array per field instead of a dict per run,
+        # so the JSON does not repeat the field names for every row. Runs
+        # already sit in file order within each task, so visiting tasks in
+        # sorted order yields (task, run) order without a separate sort.
+        model_rows = {"task": [], "run": [], "res": [], "msg": [], "ok": []}
+        for t_name in sorted(tasks_map):
+            for x in tasks_map[t_name][2]:
+                model_rows["task"].append(t_name)
+                model_rows["run"].append(x["run"])
+                model_rows["res"].append(x["res"])
+                model_rows["msg"].append(x["msg"])
+                model_rows["ok"].append(x["_ok"])
+        model_details_map[model] = model_rows
+    leaderboard.sort(key=lambda row: row["p1"], reverse=True)
+
+    # Invert to the per-task view.
+    task_summaries = []
+    task_details_map = {}
+    for t_name in sorted(task_to_models):
+        n_total = 0
+        c_total = 0
+        breakdown = []
+        for model in task_to_models[t_name]:
+            n, c, runs = stats[model][t_name]
+            n_total += n
+            c_total += c
+            # One char per run; the task page decodes it client-side.
+            run_results = "".join("S" if x["_ok"] else "F" for x in runs)
+            breakdown.append(
+                {
+                    "model": model,
+                    "type": model_type[model],
+                    "p1": round(pass_at_k(n, c, 1) * 100, 1),
+                    "runs": run_results,
+                }
+            )
+        task_summaries.append(
+            {
+                "id": t_name,
+                "models": len(breakdown),
+                "runs": n_total,
+                "rate": round(100.0 * c_total / n_total, 1) if n_total else 0.0,
+            }
+        )
+        task_details_map[t_name] = breakdown
+
+    return {
+        "leaderboard": leaderboard,
+        "tasks": task_summaries,
+        "task_details": task_details_map,
+        "model_details": model_details_map,
+    }
+
+
+_COMMON_CSS = """
+body {
+    margin: 0;
+    font-family: system-ui, -apple-system, 'Segoe UI', Roboto, sans-serif;
+    background: #f6f8fa;
+    color: #1f2328;
+}
+
+nav {
+    background: #1f2937;
+    padding: 0 24px;
+    display: flex;
+    align-items: center;
+    gap: 8px;
+}
+
+nav .brand {
+    color: #fff;
+    font-weight: 600;
+    padding: 14px 12px 14px 0;
+}
+
+nav a {
+    color: #d1d5db;
+    text-decoration: none;
+    padding: 14px 12px;
+    font-size: 14px;
+}
+
+nav a:hover {
+    color: #fff;
+    background: #374151;
+}
+
+main {
+    max-width: 960px;
+    margin: 0 auto;
+    padding: 24px;
+}
+
+h1 {
+    font-size: 22px;
+    margin: 8px 0 16px;
+}
+
+table {
+    width: 100%;
+    border-collapse: collapse;
+    background: #fff;
+    border: 1px solid #d0d7de;
+    border-radius: 6px;
+    overflow: hidden;
+}
+
+th, td {
+    text-align: left;
+    padding: 8px 12px;
+    border-bottom: 1px solid #d0d7de;
+    font-size: 14px;
+}
+
+th {
+    background: #f6f8fa;
+    cursor: pointer;
+    user-select: none;
+    white-space: nowrap;
+}
+
+th:hover {
+    background: #eaeef2;
+}
+
+tr:last-child td {
+    border-bottom: none;
+}
+
+tr:hover td {
+    background: #f6f8fa;
+}
+
+a.model-link, a.task-link {
+    color: #0969da;
+    text-decoration: none;
+}
+
+a.model-link:hover, a.task-link:hover {
+    text-decoration: underline;
+}
+
+.badge {
+    display: inline-block;
+    padding: 2px 8px;
+    border-radius: 10px;
+    background: #ddf4ff;
+    color: #0969da;
+    font-size: 12px;
+}
+
+.run-dots {
+    display: flex;
+    gap: 4px;
+}
+
+.run-dot {
+    width: 12px;
+    height: 12px;
+    border-radius: 50%;
+}
+
+.run-dot.S {
+    background: #2da44e;
+}
+
+.run-dot.F {
+    background: #cf222e;
+}
+
+.res-success {
+    color: #2da44e;
+    font-weight: 600;
+}
+
+.res-fail {
+    color: #cf222e;
+    font-weight: 600;
+}
+
+.msg {
+    color: #57606a;
+    font-size: 13px;
+    max-width: 360px;
+    overflow: hidden;
+    text-overflow: ellipsis;
+    white-space: nowrap;
+}
+
+.about p {
+    max-width: 720px;
+    line-height: 1.6;
+}
+"""
+
+# Shared helpers: HTML escaping for data-derived text and table sorting.
+_COMMON_JS = """
+function esc(s) {
+    return String(s).replace(/[&<>"']/g, c => ({
+        '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+    }[c]));
+}
+function sortTable(tableId, colIndex) {
+    const table = document.getElementById(tableId);
+    const tbody = table.tBodies[0];
+    const rows = Array.from(tbody.rows);
+    const dir = table.dataset.sortCol == colIndex &&
+        table.dataset.sortDir != 'desc' ? 'desc' : 'asc';
+    rows.sort((a, b) => {
+        const aCell = a.children[colIndex];
+        const bCell = b.children[colIndex];
+        let cmp;
+        if (aCell.dataset.sort !== undefined && bCell.dataset.sort !== undefined) {
+            // Numeric columns carry their sort key; no text parsing needed.
+            cmp = Number(aCell.dataset.sort) - Number(bCell.dataset.sort);
+        } else {
+            cmp = aCell.innerText.localeCompare(bCell.innerText);
+        }
+        return dir === 'asc' ? cmp : -cmp;
+    });
+    table.dataset.sortCol = colIndex;
+    table.dataset.sortDir = dir;
+    for (const row of rows) {
+        tbody.appendChild(row);
+    }
+}
+"""
+
+_NAV = """
+<nav>
+  <span class="brand">k8s-ai-bench</span>
+  <a href="index.html">Leaderboard</a>
+  <a href="tasks.html">Tasks</a>
+  <a href="about.html">About</a>
+</nav>
+"""
+
+
+def minify_css(css):
+    """Collapses whitespace and spacing around CSS punctuation."""
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{}:;,])\s*", r"\1", css).strip()
+
+
+def write_site_css(out_dir):
+    """Writes the shared stylesheet once, minified."""
+    write_text(os.path.join(out_dir, "site.css"), minify_css(_COMMON_CSS))
+
+
+# Everything in the head except the title is identical across pages, so the
+# concatenation (including the shared JS blob) happens once at import time.
+_STATIC_HEAD = (
+    '<meta charset="utf-8">\n'
+    '<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+    '<link rel="stylesheet" href="site.css">\n'
+    "<script>" + _COMMON_JS + "</script>\n"
+)
+
+
+def get_common_head(title):
+    """Returns the shared <head> markup."""
+    return "<head>\n<title>" + title + "</title>\n" + _STATIC_HEAD + "</head>\n"
+
+
+def write_text(path, content):
+    """Writes a text asset plus a pre-compressed .gz sibling.
+
+    Static hosts (GCS, CDNs in front of GitHub Pages) can serve the .gz
+    directly instead of compressing on the fly. Unchanged files are left
+    untouched so repeated site builds keep mtimes, rsync and deploy diffs
+    quiet.
+    """
+    data = content.encode("utf-8")
+    if os.path.exists(path) and os.path.exists(path + ".gz"):
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        with open(path, "rb") as f:
+            on_disk = hashlib.blake2b(f.read(), digest_size=16).digest()
+        if on_disk == digest:
+            return
+    with open(path, "wb") as f:
+        f.write(data)
+    with gzip.open(path + ".gz", "wb", compresslevel=9) as f:
+        f.write(data)
+
+
+def write_json(path, obj):
+    """Writes one compact JSON payload file."""
+    write_text(path, dumps(obj))
+
+
+def quote_id(name):
+    """Percent-encodes a model/task id for use as a payload filename.
+
+    The safe set mirrors JS encodeURIComponent exactly, so ids containing
+    '/' (e.g. provider-prefixed models) cannot escape the payload
+    directory. Static hosts decode the request path once before the file
+    lookup, so the pages fetch the encoded name encoded once more.
+    """
+    return urllib.parse.quote(name, safe="!*'()")
+
+
+def write_index_html(out_dir):
+    """Writes the leaderboard page; the data is fetched from leaderboard.json."""
+    content = (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n"
+        + get_common_head("k8s-ai-bench Leaderboard")
+        + "<body>\n"
+        + _NAV
+        + """
+<main>
+<h1>Leaderboard</h1>
+<table id="leaderboard">
+<thead><tr>
+<th onclick="sortTable('leaderboard', 0)">Model</th>
+<th onclick="sortTable('leaderboard', 1)">Type</th>
+<th onclick="sortTable('leaderboard', 2)">pass@1</th>
+<th onclick="sortTable('leaderboard', 3)">pass@5</th>
+<th onclick="sortTable('leaderboard', 4)">Tasks</th>
+<th onclick="sortTable('leaderboard', 5)">Runs</th>
+</tr></thead>
+<tbody id="leaderboard-body"></tbody>
+</table>
+</main>
+<script>
+// Static row fragments built once; rows are plain concatenation.
+const P = ['<td><a href="model.html?id=', '" class="model-link">',
+    '</a></td><td><span class="badge">', '</span></td><td data-sort="', '">',
+    '%</td><td data-sort="', '">', '%</td><td data-sort="', '">',
+    '</td><td data-sort="', '">', '</td>'];
+function rowHtml(row) {
+    return P[0] + encodeURIComponent(row.id) + P[1] + esc(row.id) + P[2] + esc(row.type) +
+        P[3] + row.p1 + P[4] + row.p1.toFixed(1) + P[5] + row.p5 + P[6] +
+        row.p5.toFixed(1) + P[7] + row.tasks + P[8] + row.tasks + P[9] +
+        row.runs + P[10] + row.runs + P[11];
+}
+function renderPage() {
+    const data = window.BENCHMARK_DATA;
+    const tbody = document.getElementById('leaderboard-body');
+    const frag = document.createDocumentFragment();
+    for (const row of data) {
+        const tr = document.createElement('tr');
+        tr.innerHTML = rowHtml(row);
+        frag.appendChild(tr);
+    }
+    tbody.replaceChildren(frag);
+}
+fetch('leaderboard.json').then(r => r.json()).then(d => {
+    window.BENCHMARK_DATA = d;
+    renderPage();
+});
+</script>
+</body>
+</html>
+"""
+    )
+    write_text(os.path.join(out_dir, "index.html"), content)
+
+
+def write_tasks_html(out_dir):
+    """Writes the task overview page; the data is fetched from tasks.json."""
+    content = (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n"
+        + get_common_head("k8s-ai-bench Tasks")
+        + "<body>\n"
+        + _NAV
+        + """
+<main>
+<h1>Tasks</h1>
+<table id="tasks">
+<thead><tr>
+<th onclick="sortTable('tasks', 0)">Task</th>
+<th onclick="sortTable('tasks', 1)">Models</th>
+<th onclick="sortTable('tasks', 2)">Runs</th>
+<th onclick="sortTable('tasks', 3)">Success rate</th>
+</tr></thead>
+<tbody id="tasks-body"></tbody>
+</table>
+</main>
+<script>
+// Static row fragments built once; rows are plain concatenation.
+const P = ['<td><a href="task.html?id=', '" class="task-link">',
+    '</a></td><td data-sort="', '">', '</td><td data-sort="', '">',
+    '</td><td data-sort="', '">', '%</td>'];
+function rowHtml(row) {
+    return P[0] + encodeURIComponent(row.id) + P[1] + esc(row.id) + P[2] +
+        row.models + P[3] + row.models + P[4] + row.runs + P[5] + row.runs +
+        P[6] + row.rate + P[7] + row.rate.toFixed(1) + P[8];
+}
+function renderPage() {
+    const data = window.BENCHMARK_DATA;
+    const tbody = document.getElementById('tasks-body');
+    const frag = document.createDocumentFragment();
+    for (const row of data) {
+        const tr = document.createElement('tr');
+        tr.innerHTML = rowHtml(row);
+        frag.appendChild(tr);
+    }
+    tbody.replaceChildren(frag);
+}
+fetch('tasks.json').then(r => r.json()).then(d => {
+    window.BENCHMARK_DATA = d;
+    renderPage();
+});
+</script>
+</body>
+</html>
+"""
+    )
+    write_text(os.path.join(out_dir, "tasks.html"), content)
+
+
+def write_task_detail_html(out_dir):
+    """Writes the per-task detail page (selected via ?id=<task>)."""
+    content = (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n"
+        + get_common_head("k8s-ai-bench Task")
+        + "<body>\n"
+        + _NAV
+        + """
+<main>
+<h1 id="task-title">Task</h1>
+<table id="task-breakdown">
+<thead><tr>
+<th onclick="sortTable('task-breakdown', 0)">Model</th>
+<th onclick="sortTable('task-breakdown', 1)">Type</th>
+<th onclick="sortTable('task-breakdown', 2)">pass@1</th>
+<th>Runs</th>
+</tr></thead>
+<tbody id="task-body"></tbody>
+</table>
+</main>
+<script>
+const taskId = new URLSearchParams(location.search).get('id');
+// Static row fragments built once; rows are plain concatenation.
+const P = ['<td><a href="model.html?id=', '" class="model-link">',
+    '</a></td><td><span class="badge">', '</span></td><td data-sort="', '">',
+    '%</td><td><div class="run-dots">', '</div></td>'];
+const D = ['<div class="run-dot ', '" title="Run ', ': ', '"></div>'];
+function rowHtml(row) {
+    let dots = '';
+    for (let i = 0; i < row.runs.length; i++) {
+        const v = row.runs[i];
+        dots += D[0] + v + D[1] + (i + 1) + D[2] + v + D[3];
+    }
+    return P[0] + encodeURIComponent(row.model) + P[1] + esc(row.model) + P[2] +
+        esc(row.type) + P[3] + row.p1 + P[4] + row.p1.toFixed(1) + P[5] + dots + P[6];
+}
+function renderPage() {
+    document.getElementById('task-title').textContent = taskId;
+    const data = window.BENCHMARK_DATA;
+    const tbody = document.getElementById('task-body');
+    const frag = document.createDocumentFragment();
+    for (const row of data) {
+        const tr = document.createElement('tr');
+        tr.innerHTML = rowHtml(row);
+        frag.appendChild(tr);
+    }
+    tbody.replaceChildren(frag);
+}
+// The on-disk name is the once-encoded id; encode again because the
+// server percent-decodes the request path before the file lookup.
+fetch('task_details/' + encodeURIComponent(encodeURIComponent(taskId)) + '.json').then(r => r.json()).then(d => {
+    window.BENCHMARK_DATA = d;
+    renderPage();
+});
+</script>
+</body>
+</html>
+"""
+    )
+    write_text(os.path.join(out_dir, "task.html"), content)
+
+
+def write_model_html(out_dir):
+    """Writes the per-model detail page (selected via ?id=<model>)."""
+    content = (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n"
+        + get_common_head("k8s-ai-bench Model")
+        + "<body>\n"
+        + _NAV
+        + """
+<main>
+<h1 id="model-title">Model</h1>
+<table id="model-runs">
+<thead><tr>
+<th onclick="sortTable('model-runs', 0)">Task</th>
+<th onclick="sortTable('model-runs', 1)">Run</th>
+<th onclick="sortTable('model-runs', 2)">Result</th>
+<th>Message</th>
+</tr></thead>
+<tbody id="model-body"></tbody>
+</table>
+</main>
+<script>
+const modelId = new URLSearchParams(location.search).get('id');
+// Static row fragments built once; rows are plain concatenation.
+const P = ['<td><a href="task.html?id=', '" class="task-link">',
+    '</a></td><td data-sort="', '">', '</td><td class="', '">',
+    '</td><td class="msg" title="', '">', '</td>'];
+function rowHtml(d, i) {
+    const msg = esc(d.msg[i]);
+    return P[0] + encodeURIComponent(d.task[i]) + P[1] + esc(d.task[i]) + P[2] +
+        d.run[i] + P[3] + d.run[i] + P[4] +
+        (d.ok[i] ? 'res-success' : 'res-fail') + P[5] + esc(d.res[i]) + P[6] +
+        msg + P[7] + msg + P[8];
+}
+function renderPage() {
+    document.getElementById('model-title').textContent = modelId;
+    const d = window.BENCHMARK_DATA;
+    const tbody = document.getElementById('model-body');
+    const frag = document.createDocumentFragment();
+    for (let i = 0; i < d.task.length; i++) {
+        const tr = document.createElement('tr');
+        tr.innerHTML = rowHtml(d, i);
+        frag.appendChild(tr);
+    }
+    tbody.replaceChildren(frag);
+}
+// The on-disk name is the once-encoded id; encode again because the
+// server percent-decodes the request path before the file lookup.
+fetch('model_details/' + encodeURIComponent(encodeURIComponent(modelId)) + '.json').then(r => r.json()).then(d => {
+    window.BENCHMARK_DATA = d;
+    renderPage();
+});
+</script>
+</body>
+</html>
+"""
+    )
+    write_text(os.path.join(out_dir, "model.html"), content)
+
+
+def write_about_html(out_dir):
+    """Writes the static about/methodology page."""
+    content = (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n"
+        + get_common_head("About k8s-ai-bench")
+        + "<body>\n"
+        + _NAV
+        + """
+<main class="about">
+<h1>About</h1>
+<p>k8s-ai-bench evaluates LLM-based Kubernetes agents such as
+<a href="https://github.com/GoogleCloudPlatform/kubectl-ai">kubectl-ai</a>
+against a suite of cluster administration tasks. Each (model, task) pair is
+run multiple times against a fresh kind cluster and the outcome of every run
+is recorded.</p>
+<p>The leaderboard reports <strong>pass@1</strong> (the fraction of runs that
+succeed) and <strong>pass@5</strong> (the estimated chance that at least one
+of five runs succeeds), averaged over the tasks each model attempted.</p>
+</main>
+</body>
+</html>
+"""
+    )
+    write_text(os.path.join(out_dir, "about.html"), content)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a static leaderboard site from k8s-ai-bench JSONL results."
+    )
+    parser.add_argument("--input", required=True, help="path to the JSONL results file")
+    parser.add_argument(
+        "--output-dir",
+        default=".build/k8s-ai-bench-site",
+        help="directory to write the generated site into",
+    )
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    processed_data = process_data(read_results(args.input))
+
+    # Each page fetches only the slice it renders.
+    write_json(os.path.join(args.output_dir, "leaderboard.json"), processed_data["leaderboard"])
+    write_json(os.path.join(args.output_dir, "tasks.json"), processed_data["tasks"])
+    task_details_dir = os.path.join(args.output_dir, "task_details")
+    os.makedirs(task_details_dir, exist_ok=True)
+    for t_name, breakdown in processed_data["task_details"].items():
+        write_json(os.path.join(task_details_dir, quote_id(t_name) + ".json"), breakdown)
+    model_details_dir = os.path.join(args.output_dir, "model_details")
+    os.makedirs(model_details_dir, exist_ok=True)
+    for model, rows in processed_data["model_details"].items():
+        write_json(os.path.join(model_details_dir, quote_id(model) + ".json"), rows)
+
+    write_site_css(args.output_dir)
+
+    # The pages are independent; overlap their rendering and file I/O.
+    page_writers = (
+        write_index_html,
+        write_tasks_html,
+        write_task_detail_html,
+        write_model_html,
+        write_about_html,
+    )
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(fn, args.output_dir) for fn in page_writers]
+        for future in futures:
+            future.result()
+
+
+if __name__ == "__main__":
+    main()